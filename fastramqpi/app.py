@@ -2,19 +2,24 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 """FastAPI Framework."""
+import asyncio
+from bisect import insort
 from contextlib import asynccontextmanager
 from contextlib import AsyncExitStack
 from contextlib import suppress
 from functools import partial
+from operator import itemgetter
 from typing import Any
 from typing import AsyncContextManager
 from typing import AsyncIterator
 
+import orjson
 import structlog
 from fastapi import APIRouter
 from fastapi import FastAPI
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
 from prometheus_client import Info
 from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.status import HTTP_200_OK
@@ -30,9 +35,18 @@ fastapi_router = APIRouter()
 build_information = Info("build_information", "Build information")
 
 
+# The (version, build_hash) last written to build_information, if any
+_build_information: tuple[str, str] | None = None
+
+
 def update_build_information(version: str, build_hash: str) -> None:
     """Update build information.
 
+    The metric is only written if the build information differs from the last write,
+    as it is static, but set on every app construction. Note that the last write is
+    not reset if the `Info` metric is cleared, so the early return may then leave the
+    metric empty.
+
     Args:
         version: The version to set.
         build_hash: The build hash to set.
@@ -40,19 +54,16 @@ def update_build_information(version: str, build_hash: str) -> None:
     Returns:
         None.
     """
+    global _build_information
+    if (version, build_hash) == _build_information:
+        return
     build_information.info(
         {
             "version": version,
             "hash": build_hash,
         }
     )
-
-
-@fastapi_router.get("/")
-async def index(request: Request) -> dict[str, str]:
-    """Endpoint to return name of integration."""
-    context: dict[str, Any] = request.state.context
-    return {"name": context["name"]}
+    _build_information = (version, build_hash)
 
 
 @fastapi_router.get(
@@ -71,7 +82,7 @@ async def index(request: Request) -> dict[str, str]:
         "503": {"description": "Not ready"},
     },
 )
-async def healthcheck_probe(request: Request) -> JSONResponse:
+async def healthcheck_probe(request: Request) -> ORJSONResponse:
     """Kubernetes healthcheck probe function.
 
     Kubernetes defines the probes as follows:
@@ -89,6 +100,10 @@ async def healthcheck_probe(request: Request) -> JSONResponse:
     that we can stop sending traffic to an integration while it has a temporary
     outage, but that we will only resort to actually restarting the integration
     if the situation does not seem as temporary as first assumed.
+
+    The healthchecks are run concurrently, and the remaining healthchecks are
+    cancelled as soon as one of them fails. Cancelled healthchecks are reported as
+    `null`, as their status is unknown.
     """
     status_code = HTTP_200_OK
 
@@ -100,13 +115,31 @@ async def healthcheck_probe(request: Request) -> JSONResponse:
             return await healthcheck(context)
         return False
 
-    healthstatus = {
-        name: await check(healthcheck) for name, healthcheck in healthchecks.items()
+    # Run all healthchecks concurrently, bounding the probe latency by the slowest
+    tasks = {
+        name: asyncio.create_task(check(healthcheck))
+        for name, healthcheck in healthchecks.items()
     }
-    if not all(healthstatus.values()):
-        status_code = HTTP_503_SERVICE_UNAVAILABLE
+    try:
+        for completed in asyncio.as_completed(tasks.values()):
+            if not await completed:
+                # No need to wait for the rest, as we are not ready regardless
+                status_code = HTTP_503_SERVICE_UNAVAILABLE
+                break
+
+        healthstatus = {
+            name: task.result() if task.done() else None
+            for name, task in tasks.items()
+        }
+    finally:
+        # Also cancel the healthchecks if the probe itself is cancelled, for instance
+        # if the client disconnects, so they do not outlive the request.
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
-    return JSONResponse(content=healthstatus, status_code=status_code)
+    return ORJSONResponse(content=healthstatus, status_code=status_code)
 
 
 @asynccontextmanager
@@ -118,14 +151,19 @@ async def _lifespan(app: FastAPI, context: Context) -> AsyncIterator[dict]:
     Returns:
         None
     """
+    state = {
+        "context": context,
+    }
+    lifespan_managers = context["lifespan_managers"]
+    if not lifespan_managers:
+        yield state
+        return
+
     async with AsyncExitStack() as stack:
-        lifespan_managers = context["lifespan_managers"]
-        for _, priority_set in sorted(lifespan_managers.items()):
-            for lifespan_manager in priority_set:
-                await stack.enter_async_context(lifespan_manager)
-        yield {
-            "context": context,
-        }
+        # The lifespan managers are kept sorted by priority on registration
+        for _, lifespan_manager in lifespan_managers:
+            await stack.enter_async_context(lifespan_manager)
+        yield state
 
 
 def enable_debugging() -> None:  # pragma: no cover
@@ -156,7 +194,7 @@ class FastAPIIntegrationSystem:
         self._context: Context = {
             "name": application_name,
             "settings": self.settings,
-            "lifespan_managers": {},
+            "lifespan_managers": [],
             "user_context": {},
         }
 
@@ -174,10 +212,20 @@ class FastAPIIntegrationSystem:
                 "url": "https://www.mozilla.org/en-US/MPL/2.0/",
             },
             lifespan=partial(_lifespan, context=self._context),
+            default_response_class=ORJSONResponse,
         )
         app.state.context = self._context
         app.state.healthchecks = {}
         app.include_router(fastapi_router)
+
+        # The name of the integration is static, so the response can be precomputed
+        index_body = orjson.dumps({"name": application_name})
+
+        @app.get("/", response_model=dict[str, str])
+        async def index() -> Response:
+            """Endpoint to return name of integration."""
+            return Response(content=index_body, media_type="application/json")
+
         # Expose Metrics
         if self.settings.enable_metrics:
             # Update metrics info
@@ -203,9 +251,11 @@ class FastAPIIntegrationSystem:
         Returns:
             None
         """
-
-        priority_set = self._context["lifespan_managers"].setdefault(priority, set())
-        priority_set.add(manager)
+        lifespan_managers = self._context["lifespan_managers"]
+        if (priority, manager) in lifespan_managers:
+            return
+        # Inserting after existing managers of equal priority keeps the order stable
+        insort(lifespan_managers, (priority, manager), key=itemgetter(0))
 
     def add_healthcheck(self, name: str, healthcheck: HealthcheckFunction) -> None:
         """Add the provided healthcheck to the Kubernetes readiness probe.
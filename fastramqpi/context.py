@@ -28,7 +28,7 @@ class Context(TypedDict, total=False):
 
     name: str
     settings: BaseSettings
-    lifespan_managers: dict[int, set[AsyncContextManager]]
+    lifespan_managers: list[tuple[int, AsyncContextManager]]
     app: FastAPI
     instrumentator: Instrumentator
     amqpsystem: MOAMQPSystem
@@ -19,9 +19,20 @@ def _drop_color_message_key(_: Any, __: Any, event_dict: EventDict) -> EventDict
     return event_dict
 
 
+# The (log_level, json_logs) configuration which was last applied, if any
+_configured: tuple[str, bool] | None = None
+
+
 def configure_logging(log_level: str, json_logs: bool = True) -> None:
     # Heavily inspired by OS2mo
 
+    # Logging is configured on every app construction, but reconfiguring structlog and
+    # the root logger is only necessary if the configuration has actually changed.
+    global _configured
+    configuration = (log_level.upper(), json_logs)
+    if configuration == _configured:
+        return
+
     # NOTE: We intentionally do not log timestamps, as we rely on the container runtime
     #       to add timestamps to our logs. With docker simply add `-t` to logs.
 
@@ -94,3 +105,5 @@ def configure_logging(log_level: str, json_logs: bool = True) -> None:
         # structlog
         logging.getLogger(_log).handlers.clear()
         logging.getLogger(_log).propagate = True
+
+    _configured = configuration
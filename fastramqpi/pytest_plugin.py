@@ -2,11 +2,14 @@
 # SPDX-License-Identifier: MPL-2.0
 import asyncio
 import os
+import random
 import urllib.parse
 from asyncio import CancelledError
 from asyncio import create_task
 from collections.abc import AsyncIterator
 from contextlib import suppress
+from functools import cache
+from functools import partial
 from typing import Any
 from typing import Awaitable
 from typing import Callable
@@ -16,6 +19,7 @@ from typing import NoReturn
 from unittest.mock import patch
 
 import httpx
+import orjson
 import pytest
 import sqlalchemy
 from httpx import AsyncClient
@@ -38,25 +42,33 @@ def pytest_configure(config: Config) -> None:
     )
 
 
+# Fixtures automatically used by tests marked with integration_test
+_INTEGRATION_TEST_FIXTURES: tuple[str, ...] = (
+    "fastramqpi_database_setup",
+    "fastramqpi_database_isolation",
+    "amqp_event_emitter",
+    "os2mo_database_snapshot_and_restore",
+    "amqp_queue_isolation",
+    "passthrough_backing_services",
+)
+# Fixtures automatically used by all other (unit) tests
+_UNIT_TEST_FIXTURES: tuple[str, ...] = ("empty_environment",)
+
+
 def pytest_collection_modifyitems(items: list[Item]) -> None:
     """Automatically use convenient fixtures for tests marked with integration_test."""
 
     for item in items:
         if item.get_closest_marker("integration_test"):
-            # MUST prepend to replicate auto-use fixtures coming first
-            item.fixturenames[:0] = [  # type: ignore[attr-defined]
-                "fastramqpi_database_setup",
-                "fastramqpi_database_isolation",
-                "amqp_event_emitter",
-                "os2mo_database_snapshot_and_restore",
-                "amqp_queue_isolation",
-                "passthrough_backing_services",
-            ]
+            fixtures = _INTEGRATION_TEST_FIXTURES
         else:  # unit-test
-            # MUST prepend to replicate auto-use fixtures coming first
-            item.fixturenames[:0] = [  # type: ignore[attr-defined]
-                "empty_environment",
-            ]
+            fixtures = _UNIT_TEST_FIXTURES
+        # MUST prepend to replicate auto-use fixtures coming first. A new list is built,
+        # as parametrized items share the same fixture names list.
+        item.fixturenames = [  # type: ignore[attr-defined]
+            *fixtures,
+            *item.fixturenames,  # type: ignore[attr-defined]
+        ]
 
 
 @pytest.fixture
@@ -124,22 +136,34 @@ def _settings() -> Any:
     return _Settings()
 
 
+@pytest.fixture(scope="session")
+def _amqp_url(_settings: Any) -> Any:
+    """AMQP URL of the backing RabbitMQ, parsed once per session."""
+    return _settings.amqp.get_url()
+
+
 @pytest.fixture
 async def mo_client(_settings: Any) -> AsyncIterator[AsyncClient]:
     """HTTPX client with the OS2mo URL preconfigured."""
+    # The client is deliberately function-scoped: its connection pool is bound to the
+    # event-loop it was created in, and tests run in their own function-scoped loop.
+    # Connections are still reused within a test, as all fixtures share this client.
+    # https://github.com/pytest-dev/pytest-asyncio/issues/706#issuecomment-1838860535
     async with httpx.AsyncClient(base_url=_settings.mo_url) as client:
         yield client
 
 
 @pytest.fixture
-async def rabbitmq_management_client(_settings: Any) -> AsyncIterator[AsyncClient]:
-    """HTTPX client for the RabbitMQ management API."""
-    amqp = _settings.amqp.get_url()
+async def rabbitmq_management_client(_amqp_url: Any) -> AsyncIterator[AsyncClient]:
+    """HTTPX client for the RabbitMQ management API.
+
+    Function-scoped for the same reasons as `mo_client`.
+    """
     async with httpx.AsyncClient(
-        base_url=f"http://{amqp.host}:15672/api/",
+        base_url=f"http://{_amqp_url.host}:15672/api/",
         auth=BasicAuth(
-            username=amqp.user,
-            password=amqp.password,
+            username=_amqp_url.user,
+            password=_amqp_url.password,
         ),
     ) as client:
         yield client
@@ -198,6 +222,9 @@ def fastramqpi_database_isolation(
     )
     superuser.execute(text(f"drop database if exists {test_db}"))
     superuser.execute(text(f"create database {test_db} template {template_db}"))
+    # Durability is not needed for tests. Database settings are not inherited from the
+    # template, so it must be set on the test database itself.
+    superuser.execute(text(f"alter database {test_db} set synchronous_commit = off"))
     # Patch environment so the app under test will connect to this temporary database
     monkeypatch.setenv("FASTRAMQPI__DATABASE__NAME", test_db)
 
@@ -216,8 +243,13 @@ async def amqp_event_emitter(mo_client: AsyncClient) -> AsyncIterator[None]:
 
     async def emitter() -> NoReturn:
         while True:
-            await asyncio.sleep(3)
-            r = await mo_client.post("/testing/amqp/emit")
+            # Jitter avoids synchronised emits from tests running in parallel
+            await asyncio.sleep(3 + random.random())
+            try:
+                r = await mo_client.post("/testing/amqp/emit", timeout=5)
+            except httpx.TimeoutException:
+                # A slow OS2mo should not stall the emitter; try again next round
+                continue
             r.raise_for_status()
 
     task = create_task(emitter())
@@ -252,22 +284,38 @@ async def amqp_queue_isolation(
 
     Automatically used on tests marked as integration_test.
     """
-    queues = (await rabbitmq_management_client.get("queues")).json()
+    # We must defer importing from the FastRAMQPI module till run-time.
+    # https://github.com/pytest-dev/pytest-cov/issues/587
+    from fastramqpi.ra_utils.asyncio_utils import gather_with_concurrency
+
+    r = await rabbitmq_management_client.get(
+        "queues", params={"columns": "vhost,name"}
+    )
+    queues = orjson.loads(r.content)
     # vhost and name must be URL-encoded. This includes `/`, which is normally regarded
     # as safe. This is particularly important for the default AMQP vhost `/`.
+    quote = partial(urllib.parse.quote, safe="")
+    # Most queues share the same vhost, so it is only quoted once.
+    quote_vhost = cache(quote)
+    # Empty queues are deleted too, as their bindings would otherwise leak into the
+    # next test.
     urls = (
         "queues/{vhost}/{name}".format(
-            vhost=urllib.parse.quote(q["vhost"], safe=""),
-            name=urllib.parse.quote(q["name"], safe=""),
+            vhost=quote_vhost(q["vhost"]),
+            name=quote(q["name"]),
         )
         for q in queues
     )
-    deletes = [rabbitmq_management_client.delete(url) for url in urls]
-    await asyncio.gather(*deletes)
+    # Bound the number of concurrent requests to avoid overwhelming the management API
+    await gather_with_concurrency(
+        10, *(rabbitmq_management_client.delete(url) for url in urls)
+    )
 
 
 @pytest.fixture
-def passthrough_backing_services(_settings: Any, respx_mock: MockRouter) -> None:
+def passthrough_backing_services(
+    _settings: Any, _amqp_url: Any, respx_mock: MockRouter
+) -> None:
     """Allow calls to the backing services to bypass the RESPX mocking.
 
     Automatically used on tests marked as integration_test.
@@ -275,9 +323,8 @@ def passthrough_backing_services(_settings: Any, respx_mock: MockRouter) -> None
     # mo and keycloak are named to allow tests to revert the passthrough if needed
     respx_mock.route(name="keycloak", host=_settings.auth_server.host).pass_through()
     respx_mock.route(name="mo", host=_settings.mo_url.host).pass_through()
-    # rabbitmq management
-    respx_mock.route(host=_settings.amqp.get_url().host).pass_through()
-    respx_mock.route(host="localhost").pass_through()
+    # rabbitmq management and localhost share a single route to limit route matching
+    respx_mock.route(host__in={_amqp_url.host, "localhost"}).pass_through()
 
 
 @pytest.fixture
@@ -287,7 +334,11 @@ def get_num_queued_messages(
     """Get number of queued messages in RabbitMQ AMQP."""
 
     async def _get_num_queued_messages() -> int:
-        queues = (await rabbitmq_management_client.get("queues")).json()
+        # Only request the fields we need, as queue objects are otherwise quite large
+        r = await rabbitmq_management_client.get(
+            "queues", params={"columns": "messages_ready,messages_unacknowledged"}
+        )
+        queues = orjson.loads(r.content)
         return sum(
             queue.get("messages_ready", 0) + queue.get("messages_unacknowledged", 0)
             for queue in queues
@@ -303,7 +354,10 @@ def get_num_consumed_messages(
     """Get number of consumed messages in RabbitMQ AMQP."""
 
     async def _get_num_consumed_messages() -> int:
-        queues = (await rabbitmq_management_client.get("queues")).json()
+        r = await rabbitmq_management_client.get(
+            "queues", params={"columns": "message_stats.ack"}
+        )
+        queues = orjson.loads(r.content)
         return sum(queue.get("message_stats", {}).get("ack", 0) for queue in queues)
 
     return _get_num_consumed_messages
@@ -41,6 +41,6 @@ def sentry_init(*args: Any, **kwargs: Any) -> bool:
     except ValidationError:
         log.info("Sentry init skipped")
         return False
-    log.info(f"Setting up Sentry with {settings=}")
+    log.info("Setting up Sentry", settings=settings)
     sentry_sdk.init(**settings.dict())
     return True
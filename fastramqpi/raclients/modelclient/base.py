@@ -70,7 +70,9 @@ class ModelClientBase(Generic[ModelBase]):
         reraise=True,
         wait=wait_random_exponential(multiplier=2, max=30),
         stop=stop_after_attempt(3),
-        after=lambda rs: logger.warning(f"Upload failed ({rs.attempt_number}/3)."),
+        after=lambda rs: logger.warning(
+            "Upload failed", attempt=rs.attempt_number, max_attempts=3
+        ),
     )
     async def upload_object(self, obj: ModelBase, *args: Any, **kwargs: Any) -> Any:
         response = await self.async_httpx_client.request(
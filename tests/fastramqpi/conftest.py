@@ -82,7 +82,7 @@ def fastramqpi(
 
 @pytest.fixture
 def disable_amqp_lifespan(fastramqpi: FastRAMQPI) -> Generator[None, None, None]:
-    fastramqpi._context["lifespan_managers"][1000].remove(fastramqpi.amqpsystem)
+    fastramqpi._context["lifespan_managers"].remove((1000, fastramqpi.amqpsystem))
     yield
 
 
@@ -4,7 +4,11 @@
 # pylint: disable=protected-access
 """Test the FastAPIIntegrationSystem."""
 from typing import Any
+from unittest.mock import patch
 
+from pytest import MonkeyPatch
+
+from fastramqpi import app
 from fastramqpi.app import build_information
 from fastramqpi.app import update_build_information
 
@@ -21,12 +25,32 @@ def clear_metric_value(metric: Any) -> None:
     metric.clear()
 
 
-def test_build_information() -> None:
+def test_build_information(monkeypatch: MonkeyPatch) -> None:
     """Test that build metrics are updated as expected."""
     clear_metric_value(build_information)
+    monkeypatch.setattr(app, "_build_information", None)
     assert build_information._value == {}
     update_build_information("1.0.0", "cafebabe")
     assert build_information._value == {
         "version": "1.0.0",
         "hash": "cafebabe",
     }
+
+
+def test_build_information_cached(monkeypatch: MonkeyPatch) -> None:
+    """Test that build metrics are only written when the build changes."""
+    monkeypatch.setattr(app, "_build_information", None)
+    with patch.object(build_information, "info") as info:
+        update_build_information("1.0.0", "cafebabe")
+        update_build_information("1.0.0", "cafebabe")
+        info.assert_called_once_with({"version": "1.0.0", "hash": "cafebabe"})
+
+        update_build_information("2.0.0", "deadbeef")
+        info.assert_called_with({"version": "2.0.0", "hash": "deadbeef"})
+        assert info.call_count == 2
+
+        # Changing back must write the metric again
+        update_build_information("1.0.0", "cafebabe")
+        info.assert_called_with({"version": "1.0.0", "hash": "cafebabe"})
+        assert info.call_count == 3
+
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
+# SPDX-License-Identifier: MPL-2.0
+"""Test the logging configuration."""
+import logging
+from unittest.mock import patch
+
+from pytest import MonkeyPatch
+
+from fastramqpi import logging as fastramqpi_logging
+from fastramqpi.logging import configure_logging
+
+
+def test_configure_logging_only_reconfigures_on_change(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that logging is only reconfigured if the configuration changes."""
+    # Restore the global logging state after the test
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", root_logger.handlers)
+    monkeypatch.setattr(root_logger, "level", root_logger.level)
+    monkeypatch.setattr(fastramqpi_logging, "_configured", None)
+    with patch("structlog.configure") as structlog_configure:
+        configure_logging("INFO")
+        configure_logging("info")
+        structlog_configure.assert_called_once()
+        assert logging.getLogger().level == logging.INFO
+
+        configure_logging("DEBUG")
+        assert structlog_configure.call_count == 2
+        assert logging.getLogger().level == logging.DEBUG
+
+        configure_logging("DEBUG", json_logs=False)
+        assert structlog_configure.call_count == 3
@@ -6,6 +6,7 @@
 # pylint: disable=protected-access
 # pylint: disable=unused-argument
 """Test the FastRAMQPI system."""
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 from typing import AsyncIterator
@@ -19,6 +20,7 @@ from unittest.mock import patch
 import pytest
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 from pydantic import AnyHttpUrl
 from pydantic import parse_obj_as
@@ -27,6 +29,7 @@ from pytest import MonkeyPatch
 
 import fastramqpi
 from fastramqpi import depends
+from fastramqpi.app import healthcheck_probe
 from fastramqpi.config import Settings
 from fastramqpi.context import Context
 from fastramqpi.main import construct_legacy_clients
@@ -43,6 +46,11 @@ def test_root_endpoint(test_client: TestClient) -> None:
     assert response.json() == {"name": "test"}
 
 
+def test_default_response_class(fastramqpi: FastRAMQPI) -> None:
+    """Test that responses are serialized with orjson by default."""
+    assert fastramqpi.get_app().router.default_response_class is ORJSONResponse
+
+
 @pytest.mark.usefixtures("disable_amqp_lifespan", "enable_metrics")
 def test_metrics_endpoint(fastramqpi: FastRAMQPI, test_client: TestClient) -> None:
     """Test the metrics endpoint on our app."""
@@ -77,7 +85,7 @@ def test_liveness_endpoint_healthy(
     amqp_system.healthcheck.return_value = True
 
     fastramqpi._context["amqpsystem"] = amqp_system
-    fastramqpi._context["lifespan_managers"] = {}
+    fastramqpi._context["lifespan_managers"] = []
 
     test_client = test_client_builder(fastramqpi)
 
@@ -101,7 +109,7 @@ def test_liveness_endpoint_unhealthy(
     amqp_system.healthcheck.side_effect = ValueError("BOOM")
 
     fastramqpi._context["amqpsystem"] = amqp_system
-    fastramqpi._context["lifespan_managers"] = {}
+    fastramqpi._context["lifespan_managers"] = []
 
     test_client = test_client_builder(fastramqpi)
 
@@ -114,6 +122,88 @@ def test_liveness_endpoint_unhealthy(
         }
 
 
+def test_healthchecks_run_concurrently(
+    fastramqpi: FastRAMQPI,
+    test_client_builder: Callable[..., TestClient],
+) -> None:
+    """Test that the readiness probe runs its healthchecks concurrently."""
+    fastramqpi._context["lifespan_managers"] = []
+    fastramqpi.app.state.healthchecks.clear()
+
+    events: dict[str, asyncio.Event] = {}
+
+    async def healthcheck(name: str, other: str, context: Context) -> bool:
+        # Deadlocks (and times out) unless both healthchecks run at the same time
+        events.setdefault(name, asyncio.Event()).set()
+        await asyncio.wait_for(events.setdefault(other, asyncio.Event()).wait(), 5)
+        return True
+
+    fastramqpi.add_healthcheck("A", partial(healthcheck, "A", "B"))
+    fastramqpi.add_healthcheck("B", partial(healthcheck, "B", "A"))
+
+    with test_client_builder(fastramqpi) as test_client:
+        response = test_client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"A": True, "B": True}
+
+
+def test_healthchecks_short_circuit(
+    fastramqpi: FastRAMQPI,
+    test_client_builder: Callable[..., TestClient],
+) -> None:
+    """Test that the readiness probe cancels healthchecks once one has failed."""
+    fastramqpi._context["lifespan_managers"] = []
+    fastramqpi.app.state.healthchecks.clear()
+
+    cancelled = False
+
+    async def failing(context: Context) -> bool:
+        return False
+
+    async def slow(context: Context) -> bool:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return True  # pragma: no cover
+
+    fastramqpi.add_healthcheck("Failing", failing)
+    fastramqpi.add_healthcheck("Slow", slow)
+
+    with test_client_builder(fastramqpi) as test_client:
+        response = test_client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"Failing": False, "Slow": None}
+        assert cancelled
+
+
+async def test_healthchecks_cancelled_with_probe() -> None:
+    """Test that healthchecks are cancelled if the probe request is cancelled."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow(context: Context) -> bool:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return True  # pragma: no cover
+
+    request = MagicMock()
+    request.app.state.healthchecks = {"Slow": slow}
+
+    probe = asyncio.create_task(healthcheck_probe(request))
+    await started.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert cancelled.is_set()
+
+
 @patch("fastramqpi.main.LegacyGraphQLClient")
 def test_legacy_gql_client_created_with_timeout(
     mock_gql_client: MagicMock, settings: Settings
@@ -265,38 +355,34 @@ async def dummy_lifespan_manager() -> AsyncIterator[None]:
 
 def test_add_lifespan_manager(fastramqpi: FastRAMQPI) -> None:
     """Test that add_lifespan_manager adds to the lifespan manager list."""
-    assert fastramqpi._context["lifespan_managers"].keys() == {100, 300, 400, 1000}
+
+    def priorities() -> list[int]:
+        return [priority for priority, _ in fastramqpi._context["lifespan_managers"]]
+
     # We expect LegacyGraphQLClient, LegacyModelClient, AsyncOAuth2Client MO client and
     # RAMQP to be present.
-    assert len(fastramqpi._context["lifespan_managers"][100]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][300]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][400]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][1000]) == 1
+    assert priorities() == [100, 300, 400, 1000]
 
     context_manager = dummy_lifespan_manager()
 
     fastramqpi.add_lifespan_manager(context_manager)
-    assert fastramqpi._context["lifespan_managers"].keys() == {100, 300, 400, 1000}
-    # We expect our manager to have been added
-    assert len(fastramqpi._context["lifespan_managers"][100]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][300]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][400]) == 1
-    assert len(fastramqpi._context["lifespan_managers"][1000]) == 2
+    # We expect our manager to have been added after the existing ones
+    assert priorities() == [100, 300, 400, 1000, 1000]
+    assert fastramqpi._context["lifespan_managers"][-1] == (1000, context_manager)
 
     fastramqpi.add_lifespan_manager(context_manager, priority=1)
-    assert fastramqpi._context["lifespan_managers"].keys() == {1, 100, 300, 400, 1000}
-    # We expect our manager to have been added
-    assert len(fastramqpi._context["lifespan_managers"][1]) == 1
+    # We expect our manager to have been added first
+    assert priorities() == [1, 100, 300, 400, 1000, 1000]
+    assert fastramqpi._context["lifespan_managers"][0] == (1, context_manager)
 
     fastramqpi.add_lifespan_manager(context_manager, priority=1)
-    assert fastramqpi._context["lifespan_managers"].keys() == {1, 100, 300, 400, 1000}
     # We expect our manager already exist, and not to have been readded
-    assert len(fastramqpi._context["lifespan_managers"][1]) == 1
+    assert priorities() == [1, 100, 300, 400, 1000, 1000]
 
 
 async def test_lifespan_manager_execution(fastramqpi: FastRAMQPI) -> None:
     """Test that ASGI life-management triggers our lifespan managers."""
-    fastramqpi._context["lifespan_managers"] = {}
+    fastramqpi._context["lifespan_managers"] = []
 
     events = []
 
@@ -306,8 +392,8 @@ async def test_lifespan_manager_execution(fastramqpi: FastRAMQPI) -> None:
         yield
         events.append((i, "exited"))
 
-    # Register 3 callbacks of different priorities
-    for priority in range(3):
+    # Register 3 callbacks of different priorities, in reverse order
+    for priority in reversed(range(3)):
         fastramqpi.add_lifespan_manager(
             partial(test_lifespan_manager, priority)(), priority=priority
         )